@@ -1,16 +1,87 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from itertools import count, repeat
 from jinja2 import Environment, FileSystemLoader
 from weasyprint import HTML, CSS
 import argparse
 import csv
+import hashlib
+import logging
 import os
-import pdfplumber
+import pickle
+import pymupdf
 import re
+import sys
+
+try:
+    import pdfplumber
+except ImportError:  # Only needed for the pdfplumber backend
+    pdfplumber = None
+
+try:
+    import pypdfium2
+except ImportError:  # Only needed for the pypdfium2 backend
+    pypdfium2 = None
+
+
+# The QuizCard attribute each field header starts. Note that "Club" has no
+# colon in the source PDFs.
+_HEADER_FIELDS = {
+    "Type:": "card_type",
+    "Ref:": "ref",
+    "Club": "club",
+    "Question:": "question",
+    "Answer:": "answer",
+}
+
+# Field headers are only recognised at the start of a word. The optional
+# non-space text right after a header (e.g., "Type:SIT") is captured as the
+# header's value. Each branch starts with the header itself and checks the
+# start of the word with a lookbehind afterwards, so the regex engine can skip
+# straight to the header's first letter (T, R, C, Q or A) instead of testing
+# every branch at every position.
+_FIELD_RE = re.compile(
+    "("
+    + "|".join(
+        f"{re.escape(header)}(?<!\\S.{{{len(header)}}})" for header in _HEADER_FIELDS
+    )
+    + r")(\S*)",
+    re.DOTALL,
+)
+
+# A verse format (e.g., 5:22); the word containing it ends the 'ref' field
+_VERSE_RE = re.compile(r"\d+:\d+")
+
+logger = logging.getLogger(__name__)
+
+# The Jinja environment for the PDF output. Compiled templates are kept for
+# the life of the process and never checked for changes on disk, so repeated
+# calls to save_to_pdf don't parse the template again.
+_ENV = Environment(loader=FileSystemLoader("."), auto_reload=False, cache_size=-1)
+
+# A bit for each field a card needs before it is complete
+_REQUIRED_BITS = {"card_type": 1, "ref": 2, "question": 4, "answer": 8}
+_REQUIRED_MASK = 15
+
+# How many pages each worker process parses per open of the PDF
+_PAGE_BATCH_SIZE = 10
+
+# Where parsed cards are cached between runs, keyed on the PDF's contents.
+# Bump the version whenever the parsed cards change shape or content, so
+# stale entries are not reused.
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "quiz-card")
+_CACHE_VERSION = 3
 
 
+@dataclass(slots=True)
 class QuizCard:
     """
     A class to represent a quiz card extracted from the PDF.
 
+    The fields are stored in slots rather than a per-instance __dict__, which
+    keeps the memory of large decks down and makes attribute access cheaper.
+
     Attributes:
         card_type (str): The type of the card (e.g., SIT).
         ref (str): The reference or verse associated with the card.
@@ -20,26 +91,12 @@ class QuizCard:
         answer (str): The answer to the question.
     """
 
-    def __init__(
-        self, card_type="", ref="", extra_info="", club="", question="", answer=""
-    ):
-        """
-        Initializes a QuizCard object with default empty values for each field.
-
-        Args:
-            card_type (str): The type of the card.
-            ref (str): The reference for the card.
-            extra_info (str): Extra information, mostly for SIT questions.
-            club (str): Club information (if available).
-            question (str): The question text.
-            answer (str): The answer text.
-        """
-        self.card_type = card_type
-        self.ref = ref
-        self.extra_info = extra_info
-        self.club = club
-        self.question = question
-        self.answer = answer
+    card_type: str = ""
+    ref: str = ""
+    extra_info: str = ""
+    club: str = ""
+    question: str = ""
+    answer: str = ""
 
     def __str__(self):
         """
@@ -59,191 +116,495 @@ class QuizCard:
 
     def to_dict(self):
         """
-        Converts the QuizCard object to a dictionary for CSV output.
+        Converts the QuizCard object to a dictionary for the PDF template.
 
         Returns:
             dict: A dictionary representation of the QuizCard object.
         """
         return {
-            "Type": self.card_type.strip(),
-            "Ref": self.ref.strip(),
-            "ExtraInfo": self.extra_info.strip(),
-            "Club": self.club.strip(),
-            "Question": self.question.strip(),
-            "Answer": self.answer.strip(),
+            "Type": self.card_type,
+            "Ref": self.ref,
+            "ExtraInfo": self.extra_info,
+            "Club": self.club,
+            "Question": self.question,
+            "Answer": self.answer,
         }
 
+    def to_row(self):
+        """
+        Converts the QuizCard object to a tuple of its fields, in the order of
+        the CSV columns.
+
+        Returns:
+            tuple: The card's type, ref, extra info, club, question and answer.
+        """
+        return (
+            self.card_type,
+            self.ref,
+            self.extra_info,
+            self.club,
+            self.question,
+            self.answer,
+        )
 
-def parse_pdf(file_path):
+
+class _CardBuilder:
+    """
+    Collects the text of a quiz card's fields while it is being parsed.
+
+    A single builder is reused for every card in a PDF, and each completed
+    card is handed out as a plain QuizCard holding only its final strings.
     """
-    Parses a PDF file and extracts quiz cards from it.
 
-    The function handles PDFs with two columns of text. It processes each page
-    and splits the text into words. Fields like 'Type:', 'Ref:', 'Club:',
-    'Question:', and 'Answer:' are identified, and words are appended to the
-    correct fields in a QuizCard object.
+    __slots__ = ("_parts", "_set_mask")
+
+    def __init__(self):
+        """
+        Initializes an empty builder.
+        """
+        # The text of each field. Words are buffered in lists and only joined
+        # by build(), since repeatedly appending to a string copies it every
+        # time.
+        self._parts = {}
+        # The bits from _REQUIRED_BITS of the required fields that have text,
+        # so checking whether the card is complete doesn't need to join
+        # anything
+        self._set_mask = 0
+
+    def start_field(self, name, value):
+        """
+        Starts a field with the value attached to its header, replacing any
+        text the field already had.
+
+        Args:
+            name (str): The name of the field.
+            value (str): The value attached to the field's header.
+        """
+        self._parts[name] = [value]
+        bit = _REQUIRED_BITS.get(name, 0)
+        if value:
+            self._set_mask |= bit
+        else:
+            self._set_mask &= ~bit
+
+    def append(self, name, text):
+        """
+        Appends text to a field.
+
+        Args:
+            name (str): The name of the field.
+            text (str): The text to append.
+        """
+        self._parts.setdefault(name, []).append(text)
+        if text:
+            self._set_mask |= _REQUIRED_BITS.get(name, 0)
+
+    def is_complete(self):
+        """
+        Checks whether the card has a type, reference, question and answer.
+
+        Returns:
+            bool: True if all of the required fields have text.
+        """
+        return self._set_mask == _REQUIRED_MASK
+
+    def build(self):
+        """
+        Joins the text buffered for each field into the field's string and
+        strips it, so the fields need no further cleanup on output.
+
+        The card type and club come from a handful of values across a whole
+        deck, so they are interned and every card shares the same string.
+
+        Returns:
+            QuizCard: A card with the text collected so far.
+        """
+        card = QuizCard(
+            **{name: " ".join(parts).strip() for name, parts in self._parts.items()}
+        )
+        card.card_type = sys.intern(card.card_type)
+        card.club = sys.intern(card.club)
+        return card
+
+    def reset(self):
+        """
+        Clears every field so the builder can collect the next card.
+        """
+        self._parts.clear()
+        self._set_mask = 0
+
+
+def _append_text(card, name, text):
+    """
+    Appends plain text to a field of the card being built.
+
+    Text in the 'ref' field runs up to and including the first word that
+    matches a verse format (e.g., 5:22); anything after it is extra
+    information for SIT questions and goes to the 'extra_info' field.
+
+    Args:
+        card (_CardBuilder): The card being built.
+        name (str): The name of the field to append to, or None if no field
+            header has been seen yet.
+        text (str): The text to append.
+
+    Returns:
+        str: The field that following text should be appended to.
+    """
+    # Normalize whitespace so words are joined by single spaces
+    text = " ".join(text.split())
+    if not text or name is None:
+        return name
+
+    if name == "ref":
+        match = _VERSE_RE.search(text)
+        if match:
+            # The word containing the verse is the end of the reference. The
+            # words are separated by single spaces at this point.
+            end = text.find(" ", match.end())
+            if end == -1:
+                card.append("ref", text)
+                return "extra_info"
+            card.append("ref", text[:end])
+            # Switch to the extra_info field for capturing additional data
+            # for SIT questions
+            name = "extra_info"
+            text = text[end + 1 :]
+
+    card.append(name, text)
+    return name
+
+
+@contextmanager
+def _open_pages(file_path, backend):
+    """
+    Opens a PDF file with the given text extraction backend.
+
+    Args:
+        file_path (str): The path to the PDF file.
+        backend (str): The text extraction backend ('pymupdf', 'pypdfium2' or
+            'pdfplumber').
+
+    Yields:
+        A sequence of the backend's page objects.
+
+    Raises:
+        ImportError: If an optional backend is selected but not installed.
+    """
+    if backend == "pymupdf":
+        with pymupdf.open(file_path) as doc:
+            yield doc
+    elif backend == "pypdfium2":
+        if pypdfium2 is None:
+            raise ImportError("The pypdfium2 backend requires pypdfium2.")
+        with pypdfium2.PdfDocument(file_path) as pdf:
+            yield pdf
+    elif backend == "pdfplumber":
+        if pdfplumber is None:
+            raise ImportError("The pdfplumber backend requires pdfplumber.")
+        with pdfplumber.open(file_path) as pdf:
+            yield pdf.pages
+
+
+def _column_texts(page, backend):
+    """
+    Extracts the text of the two columns of a page.
+
+    Args:
+        page: A page object from _open_pages.
+        backend (str): The text extraction backend the page was opened with.
+
+    Returns:
+        list: The text of the left and right columns, or an empty list if the
+            page has no text at all (e.g., a scanned image).
+    """
+    if backend == "pymupdf":
+        # Extract the page's words once and group them back into MuPDF's lines.
+        # Clipping the extraction to each column and having MuPDF sort it costs
+        # over 15 times as much.
+        lines = {}
+        for x0, y0, _, _, word, block_no, line_no, _ in page.get_text("words"):
+            lines.setdefault((block_no, line_no), []).append((x0, y0, word))
+        if not lines:
+            return []
+
+        # Partition the lines into the two columns by their left edge
+        mid = page.rect.width / 2
+        left, right = [], []
+        for words in lines.values():
+            x0 = words[0][0]
+            y0 = min(y for _, y, _ in words)
+            text = " ".join(word for _, _, word in words)
+            (left if x0 < mid else right).append((y0, x0, text))
+
+        # Put each column's lines into reading order, top to bottom and then
+        # left to right
+        return [
+            "\n".join(text for _, _, text in sorted(column)) for column in (left, right)
+        ]
+
+    if backend == "pypdfium2":
+        # PDFium reads the text of each column straight out of one text page.
+        # Its coordinates start at the bottom left of the page.
+        textpage = page.get_textpage()
+        if not textpage.count_chars():
+            return []
+        width, height = page.get_size()
+        mid = width / 2
+        return [
+            textpage.get_text_bounded(left=x0, bottom=0, right=x1, top=height)
+            for x0, x1 in ((0, mid), (mid, width))
+        ]
+
+    # Fetch the page's characters once and partition them into the two columns
+    # by their left edge, rather than cropping the page once per column. A
+    # single pass over the characters is about twice as fast as one filtering
+    # comprehension per column.
+    mid = page.width / 2
+    chars = page.chars
+    if not chars:
+        return []
+    left, right = [], []
+    for char in chars:
+        (left if char["x0"] < mid else right).append(char)
+
+    # Only the words matter to the parser, so take pdfplumber's words as they
+    # are rather than having it lay them out into lines of text first
+    return [
+        " ".join(word["text"] for word in pdfplumber.utils.extract_words(column))
+        for column in (left, right)
+    ]
+
+
+def _parse_pages(file_path, page_indices, backend):
+    """
+    Extracts the field events from a range of pages of a PDF file.
+
+    Each page is read as two columns of text. Each column is split on the
+    field headers 'Type:', 'Ref:', 'Club', 'Question:' and 'Answer:' with a
+    single precompiled regex. Pages are independent of each other, so this
+    runs in a worker process; stitching the events into cards is left to
+    parse_pdf. The PDF is opened once for the whole range, so the document
+    is only loaded once per batch instead of once per page.
 
     Args:
         file_path (str): The path to the PDF file to be parsed.
+        page_indices (range): The zero-based indices of the pages to parse.
+        backend (str): The text extraction backend to use.
 
     Returns:
-        list: A list of QuizCard objects extracted from the PDF.
+        list: A list of (field, text) events in reading order. For a header,
+            field is the QuizCard attribute it starts and text is the value
+            attached to it; for plain text, field is None.
+    """
+    events = []
+
+    with _open_pages(file_path, backend) as pages:
+        for page_index in page_indices:
+            for text in _column_texts(pages[page_index], backend):
+                if not text:
+                    continue
+
+                # Split the whole column on field headers in one pass. Line
+                # breaks are just whitespace between words, so there is no
+                # need to go line by line. The result is the text before the
+                # first header, followed by (header, attached value,
+                # following text) triples.
+                parts = _FIELD_RE.split(text)
+
+                # Text before the first header continues the current field
+                if parts[0]:
+                    events.append((None, parts[0]))
+
+                for i in range(1, len(parts), 3):
+                    header, value, following = parts[i : i + 3]
+                    events.append((_HEADER_FIELDS[header], value))
+                    if following:
+                        events.append((None, following))
+
+    return events
+
+
+def parse_pdf(file_path, backend="pymupdf"):
+    """
+    Parses a PDF file and extracts quiz cards from it.
+
+    The pages are parsed in parallel batches by _parse_pages (unless there
+    are too few to be worth it), and the resulting field events are then
+    replayed in page order, so cards that span a column or page break are stitched back
+    together. The text between headers is appended to the correct fields in a
+    QuizCard object.
+
+    Cards are yielded as soon as they are complete, so they can be written
+    out without holding the whole deck in memory.
+
+    Args:
+        file_path (str): The path to the PDF file to be parsed.
+        backend (str): The text extraction backend ('pymupdf', 'pypdfium2' or
+            'pdfplumber').
+
+    Yields:
+        QuizCard: Each quiz card extracted from the PDF, in order.
     """
-    cards = []
-    current_card = QuizCard()
+    current_card = _CardBuilder()
     current_field = None
 
-    with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            for i in range(2):  # Assuming there are two columns
-                x0 = i * (page.width / 2)  # Left column boundary
-                x1 = (i + 1) * (page.width / 2)  # Right column boundary
-                text = page.within_bbox((x0, 0, x1, page.height)).extract_text()
-
-                if text:
-                    # Split the column's text into lines
-                    lines = text.splitlines()
-
-                    # Loop through each line in the extracted text
-                    for line in lines:
-                        line = line.strip()  # Remove extra whitespace
-                        if line:  # Ignore empty lines
-                            words = line.split()  # Split line into individual words
-
-                            for word in words:
-                                # Detect and handle different fields based on headers
-                                if word.startswith("Type:"):
-                                    # Start of a new card detected, save the
-                                    # previous card if it's valid
-                                    if (
-                                        current_card.card_type
-                                        and current_card.ref
-                                        and current_card.question
-                                        and current_card.answer
-                                    ):
-                                        # Append the current card to the list of cards
-                                        cards.append(current_card)
-                                        # Create a new card for the next one
-                                        current_card = QuizCard()
-
-                                    # Set the current field to 'type' and store the type
-                                    current_field = "type"
-                                    current_card.card_type = word[
-                                        len("Type:") :
-                                    ].strip()
-
-                                elif word.startswith("Ref:"):
-                                    # Reference field detected, prepare to store the reference
-                                    current_field = "ref"
-                                    current_card.ref = word[len("Ref:") :].strip()
-
-                                elif current_field == "ref" and re.compile(
-                                    r"\d+:\d+"
-                                ).search(word):
-                                    # Detect end of the reference field based
-                                    # on a regex that matches a verse format
-                                    # (e.g., 5:22)
-                                    current_card.ref += " " + word
-                                    # Switch to the extra_info field for
-                                    # capturing additional data for SIT
-                                    # questions
-                                    current_field = "extra_info"
-
-                                elif word.startswith("Club"):
-                                    # Club information detected (Note: "Club" without colon ":")
-                                    current_field = "club"
-                                    current_card.club = word[len("Club") :].strip()
-
-                                elif word.startswith("Question:"):
-                                    # Question field detected, prepare to store the question
-                                    current_field = "question"
-                                    current_card.question = word[
-                                        len("Question:") :
-                                    ].strip()
-
-                                elif word.startswith("Answer:"):
-                                    # Answer field detected, prepare to store the answer
-                                    current_field = "answer"
-                                    current_card.answer = word[len("Answer:") :].strip()
-
-                                else:
-                                    # If it's just a word, append it to the
-                                    # current field. This handles multi-word
-                                    # fields like questions or answers
-                                    if current_field == "type":
-                                        current_card.card_type += " " + word
-                                    elif current_field == "ref":
-                                        current_card.ref += " " + word
-                                    elif current_field == "extra_info":
-                                        current_card.extra_info += " " + word
-                                    elif current_field == "club":
-                                        current_card.club += " " + word
-                                    elif current_field == "question":
-                                        current_card.question += " " + word
-                                    elif current_field == "answer":
-                                        current_card.answer += " " + word
+    with _open_pages(file_path, backend) as pages:
+        n_pages = len(pages)
+
+    with ExitStack() as stack:
+        if n_pages > _PAGE_BATCH_SIZE:
+            # Hand each worker a whole batch of pages at a time, so it opens
+            # the PDF once per batch rather than once per page. Batches come
+            # back in order.
+            executor = stack.enter_context(ProcessPoolExecutor())
+            batches = executor.map(
+                _parse_pages,
+                repeat(file_path),
+                (
+                    range(start, min(start + _PAGE_BATCH_SIZE, n_pages))
+                    for start in range(0, n_pages, _PAGE_BATCH_SIZE)
+                ),
+                repeat(backend),
+            )
+        else:
+            # A single batch of pages is quicker to parse here than to start
+            # worker processes for
+            batches = [_parse_pages(file_path, range(n_pages), backend)]
+
+        for events in batches:
+            for name, text in events:
+                if name is None:
+                    # Plain text continues the current field
+                    current_field = _append_text(current_card, current_field, text)
+                    continue
+
+                if name == "card_type":
+                    # Start of a new card detected, save the previous card if
+                    # it's valid
+                    if current_card.is_complete():
+                        # Hand the current card to the caller
+                        yield current_card.build()
+                        # Reuse the builder for the next card
+                        current_card.reset()
+
+                # Store the value attached to the header and make its field
+                # the current one
+                current_card.start_field(name, text)
+                current_field = name
 
     # At the end, save the last card if it's valid
-    if (
-        current_card.card_type
-        and current_card.ref
-        and current_card.question
-        and current_card.answer
-    ):
-        cards.append(current_card)
+    if current_card.is_complete():
+        yield current_card.build()
     else:
-        # Print a message if a card was incomplete
-        print(f"Incomplete card: {current_card}")
+        # Warn if a card was incomplete
+        logger.warning(f"Incomplete card: {current_card.build()}")
+
 
-    return cards  # Return the list of parsed quiz cards
+def parse_pdf_cached(file_path, backend="pymupdf"):
+    """
+    Parses a PDF file like parse_pdf, reusing the cards from an earlier run.
+
+    The cards are cached as a pickle named after a hash of the PDF's contents
+    and the backend, so rerunning on the same file skips the PDF parsing. The
+    pickle holds one list of strings per field rather than the QuizCard
+    objects, which keeps both the file and the memory used to build it small.
+
+    Args:
+        file_path (str): The path to the PDF file to be parsed.
+        backend (str): The text extraction backend ('pymupdf', 'pypdfium2' or
+            'pdfplumber').
+
+    Yields:
+        QuizCard: Each quiz card extracted from the PDF, in order.
+    """
+    with open(file_path, "rb") as pdf_file:
+        digest = hashlib.blake2b(pdf_file.read(), digest_size=16).hexdigest()
+    cache_file = os.path.join(_CACHE_DIR, f"{digest}-{backend}-v{_CACHE_VERSION}.pkl")
+
+    if os.path.exists(cache_file):
+        with open(cache_file, "rb") as f:
+            columns = pickle.load(f)
+        for row in zip(*columns):
+            yield QuizCard(*row)
+        return
+
+    columns = ([], [], [], [], [], [])
+    for card in parse_pdf(file_path, backend):
+        for column, value in zip(columns, card.to_row()):
+            column.append(value)
+        yield card
+
+    # Write to a temporary file first so an interrupted run never leaves a
+    # truncated cache entry behind
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    with open(cache_file + ".tmp", "wb") as f:
+        pickle.dump(columns, f)
+    os.replace(cache_file + ".tmp", cache_file)
 
 
 def save_to_csv(cards, output_file):
     """
-    Saves the list of QuizCards to a CSV file.
+    Saves QuizCards to a CSV file, writing them as they are produced.
 
     Args:
-        cards (list): The list of QuizCard objects to be written to the CSV file.
+        cards (iterable): The QuizCard objects to be written to the CSV file.
         output_file (str): The path to the output CSV file.
     """
-    with open(output_file, mode="w", newline="", encoding="utf-8") as csvfile:
+    # Use a 1 MiB buffer so large decks are written in a few big chunks
+    with open(
+        output_file, mode="w", newline="", encoding="utf-8", buffering=1 << 20
+    ) as csvfile:
         # Define the fieldnames for the CSV columns
         fieldnames = ["Type", "Ref", "ExtraInfo", "Club", "Question", "Answer"]
-        # Create a CSV DictWriter object to write dictionaries to the CSV
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
+        # Create a CSV writer object. Rows are written as tuples in the order
+        # of the fieldnames, which avoids building a dict for every card.
+        # Fields are only quoted when they contain a delimiter, quote or line
+        # break.
+        writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL)
 
         # Write the header row
-        writer.writeheader()
-        # Write each quiz card as a row in the CSV
+        writer.writerow(fieldnames)
+        # Write each quiz card as a row in the CSV. Most rows need no quoting
+        # at all, so they are joined and written directly, which is several
+        # times faster than going through the writer. A row is only clean if
+        # joining it added exactly one comma between each pair of fields and
+        # it has no quotes or line breaks; anything else goes through the
+        # writer so it is quoted exactly as before.
+        delimiters = len(fieldnames) - 1
+        lineterminator = writer.dialect.lineterminator
+        write = csvfile.write
         for card in cards:
-            writer.writerow(card.to_dict())
+            row = card.to_row()
+            line = ",".join(row)
+            if (
+                line.count(",") == delimiters
+                and '"' not in line
+                and "\n" not in line
+                and "\r" not in line
+            ):
+                write(line + lineterminator)
+            else:
+                writer.writerow(row)
 
 
 def save_to_pdf(cards, output_file):
     """
-    Save the list of QuizCards to a reformatted PDF file.
+    Save QuizCards to a reformatted PDF file.
 
     Args:
-        cards (list): The list of QuizCard objects to be written to the PDF file.
+        cards (iterable): The QuizCard objects to be written to the PDF file.
         output_file (str): The path to the output PDF file.
     """
-    env = Environment(loader=FileSystemLoader("."))
-    template = env.get_template("template.html")
+    template = _ENV.get_template("template.html")
 
-    html_string = '<div class="wrapper">'
-    for card in cards:
-        template_vars = card.to_dict()
-        html_string += template.render(template_vars)
+    # Render every card in a single pass of the template
+    html_string = template.render(cards=(card.to_dict() for card in cards))
 
-    html_string += "</div>"
-
-    print("------------------ HTML String ------------------")
-    print(html_string)
-
-    print("\n------------ Converting text to HTML -------------")
+    logger.debug("Converting text to HTML")
     html = HTML(string=html_string)
     css = CSS(filename="style.css")
-    print("\n------------ Converting HTML to PDF -------------")
+    logger.debug("Converting HTML to PDF")
     html.write_pdf(output_file, stylesheets=[css])
 
 
@@ -286,13 +647,46 @@ def main():
         choices=["csv", "pdf"],
         help="Specify the output format (csv or pdf). Default is csv.",
     )
+    parser.add_argument(
+        "--backend",
+        "-b",
+        default="pymupdf",
+        choices=["pymupdf", "pypdfium2", "pdfplumber"],
+        help="Specify the PDF text extraction backend. Default is pymupdf.",
+    )
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Always parse the PDF, ignoring cards cached by earlier runs.",
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Print progress messages."
+    )
     args = parser.parse_args()
 
+    # Only show progress messages when asked to. pdfminer (used by the
+    # pdfplumber backend) logs every page it parses at debug level, so keep it
+    # quiet either way.
+    logging.basicConfig(
+        format="%(message)s", level=logging.DEBUG if args.verbose else logging.WARNING
+    )
+    logging.getLogger("pdfminer").setLevel(logging.WARNING)
+
     # Check if the output file has the correct extension
     check_output_extension(args.out_file, args.output_type)
 
-    # Parse the PDF file to extract quiz cards
-    cards = parse_pdf(args.in_file)
+    # Parse the PDF file to extract quiz cards. The cards are produced lazily
+    # while the output is written.
+    if args.no_cache:
+        cards = parse_pdf(args.in_file, args.backend)
+    else:
+        cards = parse_pdf_cached(args.in_file, args.backend)
+
+    # Count the cards as they stream through to the output. zip takes a card
+    # before each number, so once the cards run out the next number is the
+    # count.
+    counter = count()
+    cards = (card for card, _ in zip(cards, counter))
 
     # Save the output based on the selected format
     if args.output_type == "csv":
@@ -300,7 +694,10 @@ def main():
     elif args.output_type == "pdf":
         save_to_pdf(cards, args.out_file)
 
-    print(f"Saved quiz cards to {args.out_file} as {args.output_type.upper()}")
+    print(
+        f"Saved {next(counter)} quiz cards to {args.out_file} as "
+        f"{args.output_type.upper()}"
+    )
 
 
 if __name__ == "__main__":